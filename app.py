@@ -1,4 +1,5 @@
 import streamlit as st
+import rates
 
 st.set_page_config(
   page_title = "Crimes Against Women in India", layout="wide"
@@ -16,4 +17,6 @@ pg=st.navigation(
   }
 )
 
+rates.measure_selector()
+
 pg.run()
@@ -1,6 +1,7 @@
 import pandas as pd
 import streamlit as st
 import plotly.express as px
+import rates
 
 # Define the URL for the dataset
 url = 'https://raw.githubusercontent.com/syazanaroslimi/IndAssSV/refs/heads/main/crime_against_women_2013_2022.csv'
@@ -19,7 +20,7 @@ def load_data(data_url):
 
 # Helper function to prepare data for metrics and visualization
 @st.cache_data
-def prepare_data_for_metrics(caw_dataset):
+def prepare_data_for_metrics(caw_dataset, measure=rates.COUNT_MODE):
     if caw_dataset.empty: return None, None
     
     caw_data_numeric = caw_dataset.iloc[1:].copy()
@@ -32,6 +33,9 @@ def prepare_data_for_metrics(caw_dataset):
         caw_data_numeric.index = pd.to_numeric(caw_data_numeric.index, errors='coerce').astype('Int64')
     except Exception as e:
         st.warning(f"Could not convert index to numeric: {e}")
+
+    # Switch between counts and rates per 100k women from the cached cube
+    caw_data_numeric = rates.select_measure(caw_data_numeric.astype(float), measure)
         
     TOTAL_CRIMES_KEY = 'Total Crimes against Women'   # access column directly
     total_crimes_series = caw_data_numeric[TOTAL_CRIMES_KEY].astype(float)       # access the series using string key
@@ -46,7 +50,9 @@ def prepare_data_for_metrics(caw_dataset):
 
 # Load and prepare the dataset
 caw_dataset = load_data(url)
-individual_crimes_df, total_crimes_series = (prepare_data_for_metrics(caw_dataset) 
+measure = rates.resolve_measure(rates.current_measure(), caw_dataset.index[1:])
+value_label = rates.value_label(measure)
+individual_crimes_df, total_crimes_series = (prepare_data_for_metrics(caw_dataset, measure) 
                                             if not caw_dataset.empty else (None, None))
 
 st.title('Objective 1: To analyse the annual trends and patterns of crimes against women in India from 2013 to 2022')
@@ -54,8 +60,8 @@ st.title('Objective 1: To analyse the annual trends and patterns of crimes again
 # summary box
 if total_crimes_series is not None and not total_crimes_series.empty:
     
-    # 1. Total Cases over the Decade
-    total_decade_cases = total_crimes_series.sum()
+    # 1. Total Cases over the Decade (average annual rate in rate mode)
+    total_decade_cases = rates.summarise_years(total_crimes_series, measure)
     
     # 2. Peak Year & Value
     peak_year = int(total_crimes_series.idxmax())
@@ -68,16 +74,28 @@ if total_crimes_series is not None and not total_crimes_series.empty:
     # metrics column (3 columns for 3 key metrics)
     col1, col2, col3 = st.columns(3)
     
-    col1.metric(
-        label="Total Cases (2013-2022)", 
-        value=f"{total_decade_cases:,.0f}", 
-        help="Cumulative number of all reported crimes over the 10-year period."
-    )
-    col2.metric(
-        label="Peak Reporting Year", 
-        value=f"{peak_year}", 
-        help=f"Year with the highest total number of reported crimes: {peak_value:,.0f} cases."
-    )
+    if rates.is_rate(measure):
+        col1.metric(
+            label="Average Annual Rate (2013-2022)", 
+            value=rates.format_value(total_decade_cases, measure), 
+            help="Mean of the yearly rates of all reported crimes per 100,000 women over the 10-year period."
+        )
+        col2.metric(
+            label="Peak Reporting Year", 
+            value=f"{peak_year}", 
+            help=f"Year with the highest rate of reported crimes: {rates.format_value(peak_value, measure)} per 100,000 women."
+        )
+    else:
+        col1.metric(
+            label="Total Cases (2013-2022)", 
+            value=rates.format_value(total_decade_cases, measure), 
+            help="Cumulative number of all reported crimes over the 10-year period."
+        )
+        col2.metric(
+            label="Peak Reporting Year", 
+            value=f"{peak_year}", 
+            help=f"Year with the highest total number of reported crimes: {peak_value:,.0f} cases."
+        )
     col3.metric(
         label="Primary Crime Category", 
         value=highest_crime, 
@@ -92,18 +110,18 @@ if 'caw_dataset' in locals() and not caw_dataset.empty:
     try:
         #st.subheader('1. Trend of Total Crimes against Women (2013-2022) - Line View')
         # Use the prepared series for visualization for consistency
-        total_crimes_series_vis = total_crimes_series.astype(int) 
+        total_crimes_series_vis = total_crimes_series if rates.is_rate(measure) else total_crimes_series.astype(int)
 
         plot_data = pd.DataFrame({
             'Year': total_crimes_series_vis.index,
-            'Number of Crimes': total_crimes_series_vis.values
+            value_label: total_crimes_series_vis.values
         })
         
         # Plotly Chart Creation
         fig = px.line(
             plot_data,
             x='Year',
-            y='Number of Crimes',
+            y=value_label,
             title='1. Trend of Total Crimes against Women From 2013 to 2022',
             markers=True
         )
@@ -123,25 +141,25 @@ else:
 if not caw_dataset.empty:
     try:
         #st.subheader('2. Trend of Total Crimes against Women (2013-2022) - Bar View')
-        total_crimes_series_vis = total_crimes_series.astype(int)
+        total_crimes_series_vis = total_crimes_series if rates.is_rate(measure) else total_crimes_series.astype(int)
 
         plot_data = pd.DataFrame({
             'Year': total_crimes_series_vis.index,
-            'Number of Crimes': total_crimes_series_vis.values
+            value_label: total_crimes_series_vis.values
         })
         
         # Chart Creation
         fig = px.bar(
             plot_data,
             x='Year',
-            y='Number of Crimes',
+            y=value_label,
             title='2. Total Crimes against Women From 2013 to 2022',
-            text='Number of Crimes',
-            color='Number of Crimes',
+            text=value_label,
+            color=value_label,
             color_continuous_scale=px.colors.sequential.Teal
         )
 
-        fig.update_traces(textposition='outside')
+        fig.update_traces(textposition='outside', texttemplate=f"%{{text:{rates.number_format(measure)}}}" if rates.is_rate(measure) else None)
         fig.update_layout(xaxis_tickformat='d')
         fig.update_xaxes(dtick=1)
 
@@ -155,17 +173,9 @@ if not caw_dataset.empty:
 if not caw_dataset.empty:
     try:
         #st.subheader('3. Annual Distribution of All Crime Categories')
-        # data preparation
-        heatmap_data_prep = caw_dataset.iloc[1:].copy()
-        heatmap_data_prep.columns = caw_dataset.iloc[0]
-        # Ensure year index is numeric for plotting consistency
-        heatmap_data_prep.index = pd.to_numeric(heatmap_data_prep.index, errors='coerce').astype('Int64')
-        heatmap_data_prep.index.name = 'Year'
-
-        if 'Total Crimes against Women' in heatmap_data_prep.columns:
-            heatmap_data_prep = heatmap_data_prep.drop(columns=['Total Crimes against Women'])
-
-        heatmap_data_numeric = heatmap_data_prep.astype(float)
+        # data preparation (reuse the prepared counts or rates, already without the total column)
+        heatmap_data_numeric = individual_crimes_df.copy()
+        heatmap_data_numeric.index.name = 'Year'
         heatmap_data_numeric = heatmap_data_numeric.dropna(axis=1, how='all')
         
         # Heatmap Creation 
@@ -177,7 +187,8 @@ if not caw_dataset.empty:
                 color_continuous_scale=px.colors.sequential.Teal,
                 title='3. Heatmap of Crimes by Category and Year',
                 aspect="auto",
-                text_auto=True
+                text_auto=rates.number_format(measure) if rates.is_rate(measure) else True,
+                labels=dict(color=value_label)
             )
             
             fig.update_xaxes(side="bottom", tickangle=45)
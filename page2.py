@@ -1,6 +1,7 @@
 import pandas as pd
 import streamlit as st
 import plotly.express as px
+import rates
 
 # Define the URL for the dataset
 url = 'https://raw.githubusercontent.com/syazanaroslimi/IndAssSV/refs/heads/main/crime_against_women_2013_2022.csv'
@@ -19,8 +20,8 @@ def load_data(data_url):
         return pd.DataFrame()
 
 @st.cache_data
-def prepare_page2_data(caw_dataset):
-    """Prepares data specifically for Objective 2 metrics and visualizations."""
+def prepare_page2_data(caw_dataset, measure=rates.COUNT_MODE):
+    """Prepares data specifically for Objective 2 metrics and visualizations, as counts or rates."""
     if caw_dataset.empty:
         return None, None, None, None
 
@@ -29,6 +30,7 @@ def prepare_page2_data(caw_dataset):
     caw_data_numeric.columns = caw_dataset.iloc[0]
     
     caw_data_numeric.index = pd.to_numeric(caw_data_numeric.index, errors='coerce').astype('Int64')     # convert index (year) to numeric
+    caw_data_numeric = rates.select_measure(caw_data_numeric.astype(float), measure)     # counts or rates per 100k women
     
     # Isolate individual crime data
     individual_crimes_df = caw_data_numeric.drop(
@@ -48,17 +50,17 @@ def prepare_page2_data(caw_dataset):
     plot_data_long = top_5_crimes_over_time.reset_index().melt(
         id_vars='index',
         var_name='Type of Crime',
-        value_name='Number of Crimes'
+        value_name=rates.value_label(measure)
     ).rename(columns={'index': 'Year'})
 
     # Calculate Metrics
     # M1: Most Frequent Crime (The name) 
     most_frequent_crime = top_5_crime_names[0]  # not use in summary box
     
-    total_top_5_cases = top_5_crimes_over_time.sum().sum()     # M2: Total Top 5 Cases
+    total_top_5_cases = rates.summarise_years(top_5_crimes_over_time.sum(axis=1), measure)     # M2: Total Top 5 Cases (average annual rate in rate mode)
 
     # M3: Contribution of Top 5 (%)
-    grand_total_all_crimes = total_crimes_series.sum()
+    grand_total_all_crimes = rates.summarise_years(total_crimes_series, measure)
     contribution_percent = (total_top_5_cases / grand_total_all_crimes) * 100
 
     # M4: Fastest Growing Crime (Top 5 only)
@@ -74,13 +76,15 @@ def prepare_page2_data(caw_dataset):
 
 # Load the dataset
 caw_dataset = load_data(url)
+measure = rates.resolve_measure(rates.current_measure(), caw_dataset.index[1:])
+value_label = rates.value_label(measure)
 
 (
     top_5_crimes_df, plot_data_long, 
     most_frequent_crime, total_top_5_cases, 
     contribution_percent, fastest_growing_crime, 
     fastest_growth_percent
-) = prepare_page2_data(caw_dataset)
+) = prepare_page2_data(caw_dataset, measure)
 
 st.title('Objective 2: To identify the top 5 crime categories and access the changing patterns of major crime rates in India from 2013 to 2022')
 
@@ -90,9 +94,10 @@ if top_5_crimes_df is not None:
     col1, col2, col3 = st.columns(3)
     
     col1.metric(
-        label="Total Cases (Top 5)", 
-        value=f"{total_top_5_cases:,.0f}", 
-        help="Cumulative cases reported across the top 5 categories for 10-decade."
+        label="Average Annual Rate (Top 5)" if rates.is_rate(measure) else "Total Cases (Top 5)", 
+        value=rates.format_value(total_top_5_cases, measure), 
+        help=("Mean yearly rate per 100,000 women across the top 5 categories from 2013 to 2022." if rates.is_rate(measure)
+              else "Cumulative cases reported across the top 5 categories for 10-decade.")
     )
     col2.metric(
         label="Top 5 Contribution", 
@@ -115,11 +120,12 @@ if not caw_dataset.empty and top_5_crimes_df is not None:
         # 1st Visualisation
         #st.subheader('1. Total Count of Top 5 Crime Categories')
         # Calculate totals for 1st graph
-        crime_totals = top_5_crimes_df.sum().sort_values(ascending=True)
+        crime_totals = rates.summarise_years(top_5_crimes_df, measure).sort_values(ascending=True)
         plot_data_v1 = pd.DataFrame({
             'Type of Crime': crime_totals.index,
             'Total Crimes': crime_totals.values
         })
+        total_label = ('Average Annual ' if rates.is_rate(measure) else '') + rates.total_label(measure)
 
         fig1 = px.bar(
             plot_data_v1,
@@ -127,13 +133,13 @@ if not caw_dataset.empty and top_5_crimes_df is not None:
             y='Type of Crime',
             orientation='h',
             title='1. Top 5 Most Frequent Crimes Against Women from 2013 to 2022',
-            labels={'Total Crimes': 'Total Number of Crimes', 'Type of Crime': 'Crime Category'},
+            labels={'Total Crimes': total_label, 'Type of Crime': 'Crime Category'},
             text='Total Crimes',
             color='Total Crimes',
             color_continuous_scale=px.colors.sequential.Teal
         )
         
-        fig1.update_traces(texttemplate='%{text:,.0f}', textposition='outside')
+        fig1.update_traces(texttemplate=f"%{{text:{rates.number_format(measure)}}}", textposition='outside')
         st.plotly_chart(fig1, use_container_width=True)
 
         # 2nd visualisation
@@ -141,11 +147,11 @@ if not caw_dataset.empty and top_5_crimes_df is not None:
         fig2 = px.line(
             plot_data_long,
             x='Year',
-            y='Number of Crimes',
+            y=value_label,
             color='Type of Crime',
             title='2. Annual Trend of Top 5 Crimes Against Women from 2013 to 2022)',
             markers=True,
-            hover_data={'Year': True, 'Number of Crimes': ':,', 'Type of Crime': True}
+            hover_data={'Year': True, value_label: ':' + rates.number_format(measure), 'Type of Crime': True}
         )
         
         fig2.update_xaxes(dtick=1)
@@ -158,11 +164,11 @@ if not caw_dataset.empty and top_5_crimes_df is not None:
         fig3 = px.bar(
             plot_data_long,
             x='Year',
-            y='Number of Crimes',
+            y=value_label,
             color='Type of Crime',
             barmode='group',
             title='3. Trend of Top 5 Crimes Against Women Over Time',
-            labels={'Number of Crimes': 'Total Number of Crimes'},
+            labels={value_label: rates.total_label(measure)},
             height=600
         )
         
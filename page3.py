@@ -2,6 +2,7 @@ import pandas as pd
 import streamlit as st
 import plotly.express as px
 import numpy as np
+import rates
 
 # Define the URL for the dataset
 url = 'https://raw.githubusercontent.com/syazanaroslimi/IndAssSV/refs/heads/main/crime_against_women_2013_2022.csv'
@@ -18,8 +19,8 @@ def load_data(data_url):
         return pd.DataFrame()
 
 @st.cache_data
-def prepare_data(caw_dataset):
-    """Cleans and prepares the data for visualization and metrics (removing total column)."""
+def prepare_data(caw_dataset, measure=rates.COUNT_MODE):
+    """Cleans and prepares the data for visualization and metrics (removing total column), as counts or rates."""
     if caw_dataset.empty: return pd.DataFrame()
     caw_data_numeric = caw_dataset.iloc[1:].copy()
     caw_data_numeric.columns = caw_dataset.iloc[0]
@@ -35,7 +36,7 @@ def prepare_data(caw_dataset):
         columns=['Total Crimes against Women'], 
         errors='ignore'
     )
-    return caw_data_numeric.astype(float)
+    return rates.select_measure(caw_data_numeric.astype(float), measure)
 
 @st.cache_data
 def prepare_page3_metrics(data_df):
@@ -65,6 +66,7 @@ def prepare_page3_metrics(data_df):
     rape_end = data_df.loc[2022, 'Rape']
     # Calculate CAGR using the formula: ((Ending Value / Starting Value) ^ (1 / Years)) - 1
     cagr_rape = ((rape_end / rape_start) ** (1/9)) - 1 if rape_start != 0 else np.nan
+    rape_change = rape_end - rape_start
 
     return {
         'largest_abs_change_crime': largest_abs_change_crime,
@@ -73,11 +75,16 @@ def prepare_page3_metrics(data_df):
         'strongest_pos_corr_crimes': f"{crime_a_pos} & {crime_b_pos}",
         'strongest_neg_corr_val': strongest_neg_corr_val,
         'strongest_neg_corr_crimes': f"{crime_a_neg} & {crime_b_neg}",
-        'cagr_rape': cagr_rape
+        'cagr_rape': cagr_rape,
+        'rape_change': rape_change
     }
 
 caw_dataset = load_data(url)
-caw_data_numeric = prepare_data(caw_dataset)
+measure = rates.resolve_measure(rates.current_measure(), caw_dataset.index[1:])
+value_label = rates.value_label(measure)
+change_unit = "per 100k Women" if rates.is_rate(measure) else "Cases"
+change_format = rates.number_format(measure)
+caw_data_numeric = prepare_data(caw_dataset, measure)
 
 st.title('Objective 3: To assess the comparison of crime rates between 2013 and 2022, the trends of rape cases in 10 years and the relationship between each type of crime against women')
 
@@ -97,10 +104,10 @@ if metrics:
     col1.metric(
         label="Largest Change (2013 vs 2022)", 
         value=metrics['largest_abs_change_crime'], 
-        delta=f"{metrics['actual_change']:+,.0f} Cases",
+        delta=f"{metrics['actual_change']:+{change_format}} {change_unit}",
         # Use inverse color since crime increase is negative news
         delta_color="inverse", 
-        help="The crime category that saw the largest absolute case number difference between 2013 and 2022."
+        help=f"The crime category that saw the largest absolute difference ({value_label.lower()}) between 2013 and 2022."
     )
     # M2: Strongest Positive Correlation
     col2.metric(
@@ -120,9 +127,9 @@ if metrics:
         label="Annual Growth Rate (Rape)", 
         value=cagr_value,
         # Delta shows whether it's growing (green/positive) or shrinking (red/negative)
-        delta=f"Total Change: {metrics['actual_change']:+,.0f}",
+        delta=f"Total Change: {metrics['rape_change']:+{change_format}}",
         delta_color="inverse", #if metrics['cagr_rape'] > 0 else "normal", 
-        help="Compound Annual Growth Rate of 'Rape' cases from 2013 to 2022."
+        help=f"Compound Annual Growth Rate of 'Rape' ({value_label.lower()}) from 2013 to 2022."
     )
 
 st.markdown("---")
@@ -142,17 +149,17 @@ if not caw_data_numeric.empty:
         plot_data = comparison_df.reset_index().melt(
             id_vars='Type of Crime', 
             var_name='Year', 
-            value_name='Number of Crimes'
+            value_name=value_label
         )
 
         fig1 = px.bar(
             plot_data,
             x='Type of Crime',
-            y='Number of Crimes',
+            y=value_label,
             color='Year',
             barmode='group',
             title='1. Crime Comparison: 2013 vs 2022',
-            labels={'Type of Crime': 'Crime Category', 'Number of Crimes': 'Total Number of Crimes'},
+            labels={'Type of Crime': 'Crime Category', value_label: rates.total_label(measure)},
             height=650
         )
         fig1.update_layout(xaxis_tickangle=-45)
@@ -171,24 +178,31 @@ if not caw_data_numeric.empty:
         plot_data_rape = pd.DataFrame({
             # Convert index (Year) back to string for axis labeling if desired, but index is already correct
             'Year': rape_trend.index.astype(str), 
-            'Number of Cases': rape_trend.values
+            value_label: rape_trend.values
         })
 
         fig2 = px.line(
             plot_data_rape,
             x='Year',
-            y='Number of Cases',
+            y=value_label,
             title='2. Trend of Rape Cases from 2013 to 2022',
             markers=True,
             height=500
         )
         
         # Customizing the Y-axis range and ticks for the 'zoom' effect
-        fig2.update_yaxes(
-            range=[27000, 40000], 
-            dtick=2000,
-            tickformat=","
-        )
+        if rates.is_rate(measure):
+            padding = (rape_trend.max() - rape_trend.min()) * 0.2
+            fig2.update_yaxes(
+                range=[rape_trend.min() - padding, rape_trend.max() + padding],
+                tickformat=".2f"
+            )
+        else:
+            fig2.update_yaxes(
+                range=[27000, 40000], 
+                dtick=2000,
+                tickformat=","
+            )
         fig2.update_xaxes(dtick=1) 
 
         st.plotly_chart(fig2, use_container_width=True)
@@ -0,0 +1,119 @@
+import os
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# Local female population table (Year, Region, Female Population)
+POPULATION_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'female_population_2013_2022.csv')
+NATIONAL_REGION = 'India'
+PER_WOMEN = 100_000
+
+COUNT_MODE = 'Counts'
+RATE_MODE = 'Rate per 100k women'
+MEASURE_KEY = 'measure'
+
+# data preparation
+@st.cache_data
+def load_population(data_path=POPULATION_PATH):
+    """Loads the female population table as a year x region frame."""
+    try:
+        data = pd.read_csv(data_path)
+        population = data.pivot(index='Year', columns='Region', values='Female Population')
+        population.index = population.index.astype('Int64')
+        return population.astype(float)
+    except Exception as e:
+        st.error(f"Error loading population data: {e}")
+        return pd.DataFrame()
+
+def build_rate_cube(count_cube, population):
+    """Divides a year x category x region count cube by a year x region population array."""
+    # Broadcast the population over the category axis instead of merging per request
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return count_cube / population[:, np.newaxis, :] * PER_WOMEN
+
+@st.cache_data
+def prepare_rates(counts_by_region):
+    """Precomputes the rate frame for every region from the year x category x region count cube."""
+    population = load_population()
+    regions = list(counts_by_region)
+    years = counts_by_region[regions[0]].index
+    categories = counts_by_region[regions[0]].columns
+
+    # Align every region on the same year x category grid and stack into a cube
+    count_cube = np.stack(
+        [counts_by_region[region].reindex(index=years, columns=categories).to_numpy(dtype=float)
+         for region in regions],
+        axis=-1
+    )
+    population_grid = population.reindex(index=years, columns=regions).to_numpy(dtype=float)
+
+    rate_cube = build_rate_cube(count_cube, population_grid)
+
+    return {region: pd.DataFrame(rate_cube[:, :, i], index=years, columns=categories)
+            for i, region in enumerate(regions)}
+
+def select_measure(counts_df, measure, region=NATIONAL_REGION):
+    """Returns the counts frame as is, or the cached rates frame for a single region."""
+    if not is_rate(measure):
+        return counts_df
+    return prepare_rates({region: counts_df})[region]
+
+def resolve_measure(measure, years, region=NATIONAL_REGION):
+    """Falls back to counts when the population table does not cover every year of the dataset."""
+    if not is_rate(measure):
+        return measure
+
+    population = load_population()
+    years = pd.to_numeric(pd.Index(years), errors='coerce')
+    if population.empty or region not in population.columns:
+        missing_years = list(years)
+    else:
+        coverage = population[region].reindex(years)
+        missing_years = list(coverage[coverage.isna()].index)
+
+    if missing_years:
+        st.warning(
+            f"Female population for {region} is missing for: {', '.join(str(year) for year in missing_years)}. "
+            "Showing counts instead of rates per 100k women."
+        )
+        return COUNT_MODE
+    return measure
+
+# measure toggle shared by all pages
+def measure_selector():
+    """Renders the sidebar toggle between raw counts and rates per 100k women."""
+    return st.sidebar.radio(
+        "Measure",
+        [COUNT_MODE, RATE_MODE],
+        key=MEASURE_KEY,
+        help="Switch every chart and metric between reported cases and cases per 100,000 women."
+    )
+
+def current_measure():
+    """Returns the measure currently selected in the sidebar."""
+    return st.session_state.get(MEASURE_KEY, COUNT_MODE)
+
+def is_rate(measure):
+    """Whether the selected measure is rates per 100k women."""
+    return measure == RATE_MODE
+
+def value_label(measure):
+    """Axis label for the selected measure."""
+    return 'Crimes per 100k Women' if is_rate(measure) else 'Number of Crimes'
+
+def total_label(measure):
+    """Axis label for a total or comparison of the selected measure."""
+    return 'Crimes per 100k Women' if is_rate(measure) else 'Total Number of Crimes'
+
+def number_format(measure):
+    """Number format spec for the selected measure."""
+    return ',.2f' if is_rate(measure) else ',.0f'
+
+def format_value(value, measure):
+    """Formats a metric value for the selected measure."""
+    return f"{value:{number_format(measure)}}"
+
+def summarise_years(data, measure):
+    """Sums counts over the years, or averages rates since each year has its own population."""
+    return data.mean() if is_rate(measure) else data.sum()